@@ -397,7 +397,8 @@ class CulqiController(http.Controller):
                 return {'success': False, 'error': 'Error creando token de pago'}
 
             token_result = token_response.json()
-            _logger.info("📋 Respuesta completa del token: %s", pprint.pformat(token_result))
+            if _logger.isEnabledFor(logging.INFO):
+                _logger.info("📋 Respuesta completa del token: %s", pprint.pformat(token_result))
             
             culqi_token = token_result.get('id')
             
@@ -453,7 +454,8 @@ class CulqiController(http.Controller):
                 return {'success': False, 'error': 'Error procesando el pago'}
 
             charge_result = charge_response.json()
-            _logger.info("📋 Respuesta completa del cargo: %s", pprint.pformat(charge_result))
+            if _logger.isEnabledFor(logging.INFO):
+                _logger.info("📋 Respuesta completa del cargo: %s", pprint.pformat(charge_result))
             
             _logger.info("✅ PASO 5 COMPLETADO: Cargo creado exitosamente")
             _logger.info("💳 Cargo ID: %s", charge_result.get('id', 'No ID'))
@@ -545,7 +547,8 @@ class CulqiController(http.Controller):
             _logger.info("📥 Datos crudos recibidos: %s", raw_data)
             
             data = json.loads(raw_data)
-            _logger.info("📊 Datos JSON parseados: %s", pprint.pformat(data))
+            if _logger.isEnabledFor(logging.INFO):
+                _logger.info("📊 Datos JSON parseados: %s", pprint.pformat(data))
             
             event_type = data.get('type')
             charge = data.get('data', {}).get('object', {})
@@ -123,7 +123,8 @@ class PaymentProvider(models.Model):
             
             # Log payload si existe
             if payload:
-                _logger.info("📦 Payload a enviar: %s", pprint.pformat(payload))
+                if _logger.isEnabledFor(logging.INFO):
+                    _logger.info("📦 Payload a enviar: %s", pprint.pformat(payload))
             else:
                 _logger.info("📦 Sin payload")
             
@@ -151,12 +152,13 @@ class PaymentProvider(models.Model):
             _logger.info("📥 Headers de respuesta: %s", dict(response.headers))
             _logger.info("📥 Tamaño de respuesta: %s bytes", len(response.content))
             
-            # Intentar parsear respuesta como JSON
-            try:
-                response_json = response.json()
-                _logger.info("📋 Respuesta JSON: %s", pprint.pformat(response_json))
-            except:
-                _logger.info("📋 Respuesta (texto): %s", response.text[:500])
+            # Intentar parsear respuesta como JSON (solo para el log)
+            if _logger.isEnabledFor(logging.INFO):
+                try:
+                    response_json = response.json()
+                    _logger.info("📋 Respuesta JSON: %s", pprint.pformat(response_json))
+                except:
+                    _logger.info("📋 Respuesta (texto): %s", response.text[:500])
             
             # Verificar si hay errores HTTP
             try:
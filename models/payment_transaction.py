@@ -15,7 +15,7 @@ _logger = logging.getLogger(__name__)
 class PaymentTransaction(models.Model):
     _inherit = 'payment.transaction'
 
-    culqi_charge_id = fields.Char(string="Culqi Charge ID", readonly=True)
+    culqi_charge_id = fields.Char(string="Culqi Charge ID", readonly=True, index=True)
 
     def _log_transaction_start(self, process_name, **kwargs):
         """Helper para loggear inicio de proceso de transacción con timestamp"""
@@ -95,8 +95,8 @@ class PaymentTransaction(models.Model):
             # Paso 2: Preparar payload para Culqi
             _logger.info("🔍 PASO 2: Preparando payload para Culqi...")
             
-            # Calcular monto en centavos
-            amount_cents = int(self.amount * 100)
+            # Calcular monto en centavos (redondeo hacia abajo con corrección de épsilon, p. ej. 19.99 -> 1999)
+            amount_cents = payment_utils.to_minor_currency_units(self.amount, self.currency_id)
             _logger.info("💰 Conversión de monto: %.2f %s -> %d centavos", 
                         self.amount, self.currency_id.name, amount_cents)
             
@@ -130,12 +130,14 @@ class PaymentTransaction(models.Model):
             _logger.info("🔍 PASO 3: Enviando solicitud a Culqi...")
             _logger.info("🌐 Endpoint: /charges")
             _logger.info("📤 Payload completo para log:")
-            _logger.info("%s", pprint.pformat(payload))
+            if _logger.isEnabledFor(logging.INFO):
+                _logger.info("%s", pprint.pformat(payload))
 
             charge = self.provider_id._culqi_make_request('/charges', payload=payload)
             
             _logger.info("📥 Respuesta recibida de Culqi:")
-            _logger.info("%s", pprint.pformat(charge))
+            if _logger.isEnabledFor(logging.INFO):
+                _logger.info("%s", pprint.pformat(charge))
             _logger.info("✅ PASO 3 COMPLETADO: Solicitud enviada y respuesta recibida")
 
             # Paso 4: Procesar respuesta
@@ -186,7 +188,7 @@ class PaymentTransaction(models.Model):
         
         self._log_transaction_start(
             "CULQI RESPONSE PROCESSING",
-            response_keys=list(response.keys()) if response else "None",
+            response_keys=response.keys() if response else "None",
             response_id=response.get('id') if response else "N/A"
         )
 
@@ -201,8 +203,10 @@ class PaymentTransaction(models.Model):
             old_charge_id = self.culqi_charge_id
             old_provider_ref = self.provider_reference
             
-            self.culqi_charge_id = charge_id
-            self.provider_reference = charge_id
+            self.write({
+                'culqi_charge_id': charge_id,
+                'provider_reference': charge_id,
+            })
             
             _logger.info("📊 Actualizaciones realizadas:")
             _logger.info("   - culqi_charge_id: %s -> %s", old_charge_id, self.culqi_charge_id)
@@ -213,7 +217,7 @@ class PaymentTransaction(models.Model):
             # Paso 2: Analizar outcome de la respuesta
             _logger.info("🔍 PASO 2: Analizando outcome de la respuesta...")
             
-            outcome = response.get('outcome', {})
+            outcome = response.get('outcome') or {}
             outcome_type = outcome.get('type')
             outcome_code = outcome.get('code')
             
@@ -289,8 +293,8 @@ class PaymentTransaction(models.Model):
         _logger.info("🚀 INICIANDO PROCESO: GET TX FROM NOTIFICATION")
         _logger.info("⏰ Timestamp: %s", time.strftime('%Y-%m-%d %H:%M:%S'))
         _logger.info("📋 Provider code: %s", provider_code)
-        _logger.info("📋 Notification data keys: %s", list(notification_data.keys()) if notification_data else "None")
-        if notification_data:
+        _logger.info("📋 Notification data keys: %s", notification_data.keys() if notification_data else "None")
+        if notification_data and _logger.isEnabledFor(logging.INFO):
             _logger.info("📋 Notification data: %s", pprint.pformat(notification_data))
         _logger.info("=" * 80)
 
@@ -331,20 +335,29 @@ class PaymentTransaction(models.Model):
             # Paso 3: Búsqueda específica para Culqi
             _logger.info("🔍 PASO 3: Búsqueda específica para Culqi...")
             
-            # Extraer referencia de metadata
+            # Extraer referencia de metadata y ID del cargo
             reference = notification_data.get('metadata', {}).get('tx_ref')
+            charge_id = notification_data.get('id')
             _logger.info("📋 Referencia extraída de metadata: %s", reference)
+            _logger.info("📋 Charge ID de la notificación: %s", charge_id)
             
             if not reference:
                 _logger.warning("⚠️ No se encontró referencia en metadata")
                 _logger.warning("📋 Metadata disponible: %s", notification_data.get('metadata', {}))
             
-            # Buscar transacción por referencia
-            _logger.info("🔍 Buscando transacción con referencia: %s", reference)
-            tx = self.search([
-                ('reference', '=', reference), 
-                ('provider_code', '=', 'culqi')
-            ])
+            # Buscar transacción por referencia o por ID de cargo en una sola consulta
+            clauses = []
+            if reference:
+                clauses.append(('reference', '=', reference))
+            if charge_id:
+                clauses.append(('culqi_charge_id', '=', charge_id))
+            if len(clauses) == 2:
+                clauses.insert(0, '|')
+            
+            _logger.info("🔍 Buscando transacción con dominio: %s", clauses)
+            candidates = self.search([('provider_code', '=', 'culqi')] + clauses) if clauses else self.browse()
+            # La referencia tiene prioridad sobre el ID de cargo si apuntan a transacciones distintas
+            tx = candidates.filtered(lambda t: t.reference == reference)[:1] or candidates[:1]
             
             _logger.info("📊 Resultado de búsqueda específica:")
             if tx:
@@ -356,7 +369,10 @@ class PaymentTransaction(models.Model):
                 _logger.info("   - No se encontraron transacciones")
             
             if not tx:
-                error_msg = f"Culqi: No se encontró la transacción con referencia {reference}."
+                error_msg = _(
+                    "Culqi: No se encontró la transacción con referencia %(reference)s ni con cargo %(charge_id)s.",
+                    reference=reference, charge_id=charge_id,
+                )
                 _logger.error("❌ %s", error_msg)
                 
                 elapsed_time = time.time() - start_time
@@ -366,7 +382,7 @@ class PaymentTransaction(models.Model):
                 _logger.info("📊 Error: Transacción no encontrada")
                 _logger.info("-" * 80)
                 
-                raise ValidationError(_(error_msg))
+                raise ValidationError(error_msg)
             
             _logger.info("✅ PASO 3 COMPLETADO: Transacción encontrada")
 
@@ -397,7 +413,7 @@ class PaymentTransaction(models.Model):
         
         self._log_transaction_start(
             "PROCESS NOTIFICATION DATA",
-            notification_data_keys=list(notification_data.keys()) if notification_data else "None",
+            notification_data_keys=notification_data.keys() if notification_data else "None",
             provider_code=self.provider_code
         )
 
@@ -425,11 +441,12 @@ class PaymentTransaction(models.Model):
             # Paso 3: Extraer datos de la notificación
             _logger.info("🔍 PASO 3: Extrayendo datos de notificación...")
             
-            _logger.info("📋 Notification data completa: %s", pprint.pformat(notification_data))
+            if _logger.isEnabledFor(logging.INFO):
+                _logger.info("📋 Notification data completa: %s", pprint.pformat(notification_data))
             
-            status = notification_data.get('outcome', {}).get('type')
+            outcome = notification_data.get('outcome') or {}
+            status = outcome.get('type')
             charge_id = notification_data.get('id')
-            outcome = notification_data.get('outcome', {})
             
             _logger.info("📊 Datos extraídos:")
             _logger.info("   - Status: %s", status)
@@ -440,8 +457,10 @@ class PaymentTransaction(models.Model):
             old_charge_id = self.culqi_charge_id
             old_provider_ref = self.provider_reference
             
-            self.culqi_charge_id = charge_id
-            self.provider_reference = charge_id
+            self.write({
+                'culqi_charge_id': charge_id,
+                'provider_reference': charge_id,
+            })
             
             _logger.info("📊 Campos actualizados:")
             _logger.info("   - culqi_charge_id: %s -> %s", old_charge_id, self.culqi_charge_id)
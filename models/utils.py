@@ -1,10 +1,17 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
+import re
+
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7f]')
+
+
 def get_clean_email(email):
     """Quita caracteres invisibles o no ASCII del correo electrónico."""
     if not email:
         return ''
-    return email.encode('ascii', 'ignore').decode('utf-8')
+    if email.isascii():
+        return email
+    return _NON_ASCII_RE.sub('', email)
 
 
 def get_partner_email(partner):
@@ -0,0 +1,127 @@
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+from unittest.mock import patch
+from odoo.tests import tagged
+from odoo.exceptions import ValidationError
+from odoo.addons.payment_culqi.tests.common import CulqiCommon
+
+
+@tagged('post_install', '-at_install')
+class CulqiTransactionTest(CulqiCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        # Transacción compartida: cada test se ejecuta en su propio savepoint,
+        # por lo que los cambios de estado no se filtran entre tests. Mismos
+        # valores por defecto que `PaymentCommon._create_transaction` (flujo
+        # directo), con referencia propia para no chocar con ese helper.
+        cls.tx = cls.env['payment.transaction'].create({
+            'payment_method_id': cls.payment_method_id,
+            'amount': cls.amount,
+            'currency_id': cls.currency.id,
+            'provider_id': cls.provider.id,
+            'reference': f'{cls.reference}-shared',
+            'operation': 'online_direct',
+            'partner_id': cls.partner.id,
+        })
+
+    def test_culqi_transaction_process_success(self):
+        """ Verifica que una transacción se complete correctamente con un token válido. """
+        tx = self.tx
+
+        mock_response = {
+            'id': 'charge_test_id_123',
+            'outcome': {'type': 'venta_exitosa'},
+        }
+
+        with patch(
+            'odoo.addons.payment_culqi.models.payment_provider.PaymentProvider._culqi_make_request',
+            return_value=mock_response,
+        ):
+            tx._get_specific_processing_values({'culqi_token': 'tok_test_123'})
+
+        self.assertEqual(tx.state, 'done')
+        self.assertEqual(tx.provider_reference, 'charge_test_id_123')
+        self.assertEqual(tx.culqi_charge_id, 'charge_test_id_123')
+
+    def test_culqi_transaction_missing_token(self):
+        """ Asegura que la transacción falle si no se proporciona el token. """
+        tx = self.tx
+
+        with self.assertRaises(ValidationError):
+            tx._get_specific_processing_values({})  # Sin token
+
+    def test_culqi_transaction_rejected(self):
+        """ Verifica que una transacción con respuesta negativa quede en estado de error. """
+        tx = self.tx
+
+        mock_response = {
+            'id': 'charge_fail_456',
+            'outcome': {'type': 'venta_rechazada'},
+        }
+
+        with patch(
+            'odoo.addons.payment_culqi.models.payment_provider.PaymentProvider._culqi_make_request',
+            return_value=mock_response,
+        ):
+            tx._get_specific_processing_values({'culqi_token': 'tok_fail_456'})
+
+        self.assertEqual(tx.state, 'error')
+
+    def test_culqi_tx_from_notification_by_charge_id(self):
+        """ Verifica que una notificación sin metadata se resuelva por el ID de cargo. """
+        self.tx.culqi_charge_id = 'chr_test_lookup_789'
+
+        tx = self.env['payment.transaction']._get_tx_from_notification_data(
+            'culqi', {'id': 'chr_test_lookup_789'}
+        )
+
+        self.assertEqual(tx, self.tx)
+
+    def test_culqi_tx_from_notification_reference_priority(self):
+        """ Asegura que la referencia prevalezca si el ID de cargo apunta a otra transacción. """
+        other_tx = self._create_transaction(
+            provider_id=self.provider.id,
+            amount=self.amount,
+            currency_id=self.currency.id,
+            flow='direct',
+            culqi_charge_id='chr_other_321',
+        )
+
+        tx = self.env['payment.transaction']._get_tx_from_notification_data(
+            'culqi', {'id': 'chr_other_321', 'metadata': {'tx_ref': self.tx.reference}}
+        )
+
+        self.assertNotEqual(tx, other_tx)
+        self.assertEqual(tx, self.tx)
+
+    def test_culqi_tx_from_notification_not_found(self):
+        """ Asegura que se lance un error si ni la referencia ni el cargo coinciden. """
+        with self.assertRaises(ValidationError):
+            self.env['payment.transaction']._get_tx_from_notification_data(
+                'culqi', {'id': 'chr_missing_000'}
+            )
+
+    def test_culqi_transaction_amount_in_cents(self):
+        """ Verifica que el monto se envíe en centavos sin perder un céntimo por truncamiento. """
+        tx = self._create_transaction(
+            provider_id=self.provider.id,
+            amount=19.99,
+            currency_id=self.currency.id,
+            flow='direct',
+        )
+
+        mock_response = {
+            'id': 'charge_cents_999',
+            'outcome': {'type': 'venta_exitosa'},
+        }
+
+        with patch(
+            'odoo.addons.payment_culqi.models.payment_provider.PaymentProvider._culqi_make_request',
+            return_value=mock_response,
+        ) as mock_request:
+            tx._get_specific_processing_values({'culqi_token': 'tok_cents_999'})
+
+        self.assertEqual(mock_request.call_args.kwargs['payload']['amount'], 1999)